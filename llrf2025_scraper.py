@@ -19,16 +19,89 @@ Features:
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import os
-import json
+import shutil
+import orjson
 import time
 import re
-from urllib.parse import urljoin, urlparse
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any
 import logging
+import threading
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
+from email.utils import formatdate
+
+# Filename sanitization tables, built once at import time
+_INVALID_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*\r\n'})
+_WS_RE = re.compile(r'\s+')
+
+# (output key, API key, default) for flat contribution fields, in output order.
+# Entries with API key None start at their default and are derived in parse_contribution.
+_CONTRIB_FIELDS = (
+    ('id', 'id', ''),
+    ('db_id', 'db_id', ''),
+    ('friendly_id', 'friendly_id', ''),
+    ('title', 'title', ''),
+    ('type', 'type', ''),
+    ('description', 'description', ''),
+    ('start_date', None, ''),
+    ('start_time', None, ''),
+    ('end_date', None, ''),
+    ('end_time', None, ''),
+    ('duration', 'duration', 0),
+    ('location', 'location', ''),
+    ('room', 'room', ''),
+    ('url', 'url', ''),
+    ('session', None, ''),
+    ('track', None, ''),
+    ('board_number', 'board_number', ''),
+    ('code', 'code', ''),
+)
+
+# (output key, API key) for speaker/author entries
+_PERSON_FIELDS = (
+    ('name', 'fullName'),
+    ('first_name', 'first_name'),
+    ('last_name', 'last_name'),
+    ('affiliation', 'affiliation'),
+    ('id', 'id'),
+)
+
+def _dump_indented(obj: Any, depth: int) -> bytes:
+    """Encode obj as 2-space indented JSON for a fragment nested depth levels deep."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).replace(b'\n', b'\n' + b'  ' * depth)
+
+def _csv_field(key: str, default: Any = ''):
+    """Return an extractor reading one key of a parsed contribution."""
+    return lambda contrib: contrib.get(key, default)
+
+# (column name, extractor) pairs for the CSV export, in column order
+_CSV_COLUMNS = (
+    ('id', _csv_field('id')),
+    ('friendly_id', _csv_field('friendly_id')),
+    ('title', _csv_field('title')),
+    ('type', _csv_field('type')),
+    ('start_date', _csv_field('start_date')),
+    ('start_time', _csv_field('start_time')),
+    ('duration', _csv_field('duration')),
+    ('speakers', _csv_field('_speakers_str')),
+    ('primary_authors', _csv_field('_primary_authors_str')),
+    ('coauthors', _csv_field('_coauthors_str')),
+    ('affiliations', _csv_field('_affiliations_str')),
+    ('description', lambda contrib: contrib.get('description', '')[:500]),  # Truncate long descriptions
+    ('attachment_count', _csv_field('attachment_count', 0)),
+    ('url', _csv_field('url')),
+    ('session', _csv_field('session')),
+    ('location', _csv_field('location')),
+    ('room', _csv_field('room')),
+)
+_CSV_FIELDNAMES = tuple(name for name, _ in _CSV_COLUMNS)
 
 class LLRF2025Scraper:
     """
@@ -38,7 +111,8 @@ class LLRF2025Scraper:
     organizing data by sessions and downloading available attachments.
     """
     
-    def __init__(self, event_id: str = "939", base_url: str = "https://indico.jlab.org", output_dir: str = "LLRF2025_Data"):
+    def __init__(self, event_id: str = "939", base_url: str = "https://indico.jlab.org", output_dir: str = "LLRF2025_Data",
+                 max_workers: int = 8, verbose: bool = False):
         """
         Initialize the LLRF2025 scraper.
         
@@ -46,31 +120,46 @@ class LLRF2025Scraper:
             event_id: Indico event ID
             base_url: Base URL of the Indico server
             output_dir: Directory to store scraped data and files
+            max_workers: Maximum number of concurrent attachment downloads
+            verbose: Log per-file download details to the log file
         """
         self.event_id = event_id
+        self.max_workers = max_workers
         self.base_url = base_url
         self.api_url = f"{base_url}/export/event/{event_id}.json?detail=contributions"
         self.output_dir = Path(output_dir)
+        # Single timestamp shared by all output files of this run
+        self._scrape_time = datetime.now()
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'application/json,text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            # Advertise br/zstd only when urllib3 has a decoder for them (urllib3[brotli], optionally [zstd])
+            'Accept-Encoding': DEFAULT_ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         })
         
-        # Setup logging
+        # Reuse pooled connections and let the server pace us via Retry-After.
+        # The pool must hold at least one connection per download worker.
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(16, max_workers), max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Setup logging: per-file details (verbose mode) go to the log file only
+        file_handler = logging.FileHandler('llrf2025_scraper.log', encoding='utf-8')
+        file_handler.setLevel(logging.DEBUG)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setLevel(logging.INFO)
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('llrf2025_scraper.log', encoding='utf-8'),
-                logging.StreamHandler()
-            ]
+            handlers=[file_handler, stream_handler]
         )
         self.logger = logging.getLogger(__name__)
+        self.logger.setLevel(logging.DEBUG if verbose else logging.INFO)
         
         # Initialize directories and statistics
         self.create_directories()
@@ -82,10 +171,14 @@ class LLRF2025Scraper:
             'errors': 0,
             'sessions_processed': 0
         }
+        self._stats_lock = threading.Lock()
         
         # Event data
         self.event_data = None
         self.contributions = []
+        
+        # Rendered text summaries keyed by contribution id
+        self._summary_cache = {}
     
     def create_directories(self):
         """Create necessary directory structure for output files."""
@@ -112,9 +205,8 @@ class LLRF2025Scraper:
             return "unknown"
         
         # Remove invalid characters
-        filename = re.sub(r'[<>:"/\\|?*\r\n]', '_', filename)
-        filename = re.sub(r'\s+', ' ', filename)
-        filename = filename.strip(' ._')
+        filename = filename.translate(_INVALID_TRANS)
+        filename = _WS_RE.sub(' ', filename).strip(' ._')
         
         # Truncate if too long
         if len(filename) > max_length:
@@ -134,7 +226,7 @@ class LLRF2025Scraper:
             response = self.session.get(self.api_url, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             if data.get('count', 0) > 0 and 'results' in data:
                 self.event_data = data['results'][0]
@@ -168,62 +260,18 @@ class LLRF2025Scraper:
         start_date_obj = contrib.get('startDate') or {}
         end_date_obj = contrib.get('endDate') or {}
         
-        contribution_info = {
-            'id': contrib.get('id', ''),
-            'db_id': contrib.get('db_id', ''),
-            'friendly_id': contrib.get('friendly_id', ''),
-            'title': contrib.get('title', ''),
-            'type': contrib.get('type', ''),
-            'description': contrib.get('description', ''),
-            'start_date': start_date_obj.get('date', ''),
-            'start_time': start_date_obj.get('time', ''),
-            'end_date': end_date_obj.get('date', ''),
-            'end_time': end_date_obj.get('time', ''),
-            'duration': contrib.get('duration', 0),
-            'location': contrib.get('location', ''),
-            'room': contrib.get('room', ''),
-            'url': contrib.get('url', ''),
-            'session': str(contrib.get('session', '')) if contrib.get('session') else '',
-            'track': str(contrib.get('track', '')) if contrib.get('track') else '',
-            'board_number': contrib.get('board_number', ''),
-            'code': contrib.get('code', ''),
-        }
+        contribution_info = {dst: contrib.get(src, default) if src else default for dst, src, default in _CONTRIB_FIELDS}
+        contribution_info['start_date'] = start_date_obj.get('date', '')
+        contribution_info['start_time'] = start_date_obj.get('time', '')
+        contribution_info['end_date'] = end_date_obj.get('date', '')
+        contribution_info['end_time'] = end_date_obj.get('time', '')
+        contribution_info['session'] = str(contrib['session']) if contrib.get('session') else ''
+        contribution_info['track'] = str(contrib['track']) if contrib.get('track') else ''
         
-        # Extract speakers
-        speakers = []
-        for speaker in contrib.get('speakers', []):
-            speakers.append({
-                'name': speaker.get('fullName', ''),
-                'first_name': speaker.get('first_name', ''),
-                'last_name': speaker.get('last_name', ''),
-                'affiliation': speaker.get('affiliation', ''),
-                'id': speaker.get('id', '')
-            })
-        contribution_info['speakers'] = speakers
-        
-        # Extract primary authors
-        primary_authors = []
-        for author in contrib.get('primaryauthors', []):
-            primary_authors.append({
-                'name': author.get('fullName', ''),
-                'first_name': author.get('first_name', ''),
-                'last_name': author.get('last_name', ''),
-                'affiliation': author.get('affiliation', ''),
-                'id': author.get('id', '')
-            })
-        contribution_info['primary_authors'] = primary_authors
-        
-        # Extract co-authors
-        coauthors = []
-        for author in contrib.get('coauthors', []):
-            coauthors.append({
-                'name': author.get('fullName', ''),
-                'first_name': author.get('first_name', ''),
-                'last_name': author.get('last_name', ''),
-                'affiliation': author.get('affiliation', ''),
-                'id': author.get('id', '')
-            })
-        contribution_info['coauthors'] = coauthors
+        # Extract speakers and authors
+        contribution_info['speakers'] = self._parse_people(contrib.get('speakers', []))
+        contribution_info['primary_authors'] = self._parse_people(contrib.get('primaryauthors', []))
+        contribution_info['coauthors'] = self._parse_people(contrib.get('coauthors', []))
         
         # Extract attachments
         attachments = []
@@ -245,8 +293,53 @@ class LLRF2025Scraper:
         # Keywords
         contribution_info['keywords'] = contrib.get('keywords', [])
         
+        # Derived display strings shared by the exporters (stripped from JSON output)
+        person_lists = (contribution_info['speakers'], contribution_info['primary_authors'], contribution_info['coauthors'])
+        contribution_info['_speakers_str'] = '; '.join([s['name'] for s in contribution_info['speakers']])
+        contribution_info['_primary_authors_str'] = '; '.join([a['name'] for a in contribution_info['primary_authors']])
+        contribution_info['_coauthors_str'] = '; '.join([a['name'] for a in contribution_info['coauthors']])
+        contribution_info['_affiliations_str'] = '; '.join(sorted(
+            {p['affiliation'] for people in person_lists for p in people if p.get('affiliation')}
+        ))
+        
         return contribution_info
     
+    def _public_fields(self, contrib: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a contribution without the derived underscore-prefixed keys."""
+        return {k: v for k, v in contrib.items() if not k.startswith('_')}
+    
+    def _parse_people(self, people: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Parse a list of speakers or authors from API data."""
+        return [{dst: person.get(src, '') for dst, src in _PERSON_FIELDS} for person in people]
+    
+    def _attachment_path(self, attachment: Dict[str, Any], contrib_info: Dict[str, Any], category_folder: str) -> Path:
+        """Return the local path an attachment is downloaded to."""
+        contrib_id = contrib_info.get('friendly_id', contrib_info.get('id', 'unknown'))
+        safe_title = self.safe_filename(contrib_info['title'])
+        folder_name = f"{contrib_id} - {safe_title}"
+        
+        original_filename = attachment.get('filename', attachment.get('title', 'attachment'))
+        return self.output_dir / category_folder / folder_name / self.safe_filename(original_filename)
+    
+    def _download_attachment_group(self, jobs: List[tuple], category_folder: str) -> int:
+        """
+        Download attachments that share one target path, one after another.
+        
+        Only the first attachment that downloads successfully is kept; the
+        rest are skipped, as they would find that file already in place.
+        
+        Args:
+            jobs: (attachment, contribution) pairs resolving to the same file
+            category_folder: Category folder name (e.g., "Oral_Presentations")
+            
+        Returns:
+            Number of attachments handled successfully (downloaded or skipped)
+        """
+        for failed, (attachment, contrib) in enumerate(jobs):
+            if self.download_attachment(attachment, contrib, category_folder):
+                return len(jobs) - failed
+        return 0
+    
     def download_attachment(self, attachment: Dict[str, Any], contrib_info: Dict[str, Any], category_folder: str) -> bool:
         """
         Download a single attachment file.
@@ -263,40 +356,61 @@ class LLRF2025Scraper:
             download_url = attachment['download_url']
             
             # Create contribution folder
-            contrib_id = contrib_info.get('friendly_id', contrib_info.get('id', 'unknown'))
-            safe_title = self.safe_filename(contrib_info['title'])
-            folder_name = f"{contrib_id} - {safe_title}"
-            
-            target_dir = self.output_dir / category_folder / folder_name
-            target_dir.mkdir(exist_ok=True, parents=True)
-            
-            # Get filename
-            original_filename = attachment.get('filename', attachment.get('title', 'attachment'))
-            safe_name = self.safe_filename(original_filename)
-            
-            filepath = target_dir / safe_name
+            filepath = self._attachment_path(attachment, contrib_info, category_folder)
+            filepath.parent.mkdir(exist_ok=True, parents=True)
+            safe_name = filepath.name
             
+            headers = {}
             if filepath.exists():
-                self.logger.info(f"File already exists, skipping: {safe_name}")
-                return True
+                local_stat = filepath.stat()
+                expected_size = attachment.get('size')
+                if expected_size and local_stat.st_size != expected_size:
+                    # Truncated copy left by an interrupted run: its mtime would make
+                    # the server answer 304, so fetch it again unconditionally
+                    self.logger.debug("Local copy incomplete, re-downloading: %s", safe_name)
+                elif not attachment.get('modified_dt'):
+                    self.logger.debug("File already exists, skipping: %s", safe_name)
+                    return True
+                else:
+                    # Only fetch again if the attachment changed since our local copy
+                    headers['If-Modified-Since'] = formatdate(local_stat.st_mtime, usegmt=True)
             
             # Download file
-            self.logger.info(f"Downloading: {safe_name}")
-            response = self.session.get(download_url, stream=True, timeout=60)
+            self.logger.debug("Downloading: %s", safe_name)
+            response = self.session.get(download_url, headers=headers, stream=True, timeout=60)
+            if response.status_code == 304:
+                # Consume the empty body so the keep-alive connection goes back to the
+                # pool; close() would tear it down and force a new TLS handshake
+                _ = response.content
+                self.logger.debug("File not modified, skipping: %s", safe_name)
+                return True
             response.raise_for_status()
             
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Copy the raw stream in 1 MiB blocks, letting urllib3 undo gzip/deflate.
+            # Write to a temp file next to the target and move it into place only
+            # once complete, so a failed download never leaves a partial file.
+            response.raw.decode_content = True
+            # Exclusive create keeps the usual umask-based permissions (mkstemp would force 0600)
+            tmp_path = filepath.with_name(f".{safe_name}.{uuid.uuid4().hex}.part")
+            try:
+                with open(tmp_path, 'xb') as f:
+                    shutil.copyfileobj(response.raw, f, length=1 << 20)
+                os.replace(tmp_path, filepath)
+            except BaseException:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+                raise
             
-            file_size = filepath.stat().st_size
-            self.logger.info(f"✅ Downloaded: {safe_name} ({file_size} bytes)")
-            self.stats['downloaded_files'] += 1
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("✅ Downloaded: %s (%d bytes)", safe_name, filepath.stat().st_size)
+            with self._stats_lock:
+                self.stats['downloaded_files'] += 1
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to download {attachment.get('filename', 'attachment')}: {e}")
-            self.stats['errors'] += 1
+            self.logger.error("Failed to download %s: %s", attachment.get('filename', 'attachment'), e)
+            with self._stats_lock:
+                self.stats['errors'] += 1
             return False
     
     def process_contributions(self):
@@ -345,19 +459,39 @@ class LLRF2025Scraper:
         self.save_by_date(oral_contributions + poster_contributions + other_contributions)
     
     def _process_contribution_list(self, contributions: List[Dict[str, Any]], category_folder: str):
-        """Process a list of contributions and download their attachments."""
-        self.logger.info(f"\nProcessing {len(contributions)} contributions in {category_folder}...")
+        """Process a list of contributions and download their attachments concurrently."""
+        self.logger.info("\nProcessing %d contributions in %s...", len(contributions), category_folder)
         
+        # Attachments resolving to the same file (e.g. two "slides.pdf") share one
+        # job so they are never written concurrently; the first successful one wins
+        jobs_by_path = defaultdict(list)
         for i, contrib in enumerate(contributions, 1):
-            contrib_id = contrib.get('friendly_id', contrib.get('id', 'unknown'))
-            title = contrib['title'][:60] + '...' if len(contrib['title']) > 60 else contrib['title']
+            if self.logger.isEnabledFor(logging.DEBUG):
+                contrib_id = contrib.get('friendly_id', contrib.get('id', 'unknown'))
+                title = contrib['title'][:60] + '...' if len(contrib['title']) > 60 else contrib['title']
+                self.logger.debug("  [%d/%d] %s: %s", i, len(contributions), contrib_id, title)
             
-            self.logger.info(f"  [{i}/{len(contributions)}] {contrib_id}: {title}")
-            
-            # Download attachments
             for attachment in contrib.get('attachments', []):
-                self.download_attachment(attachment, contrib, category_folder)
-                time.sleep(0.5)  # Avoid too frequent requests
+                jobs_by_path[self._attachment_path(attachment, contrib, category_folder)].append((attachment, contrib))
+        
+        total = sum(len(jobs) for jobs in jobs_by_path.values())
+        succeeded = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            # At most max_workers downloads run at once
+            futures = [pool.submit(self._download_attachment_group, jobs, category_folder)
+                       for jobs in jobs_by_path.values()]
+            try:
+                for future in as_completed(futures):
+                    succeeded += future.result()
+            except BaseException:
+                # Drop queued downloads so Ctrl+C does not wait for all of them;
+                # shutdown(cancel_futures=True) would need Python 3.9
+                for future in futures:
+                    future.cancel()
+                raise
+        
+        if total:
+            self.logger.info("Attachments in %s: %d/%d succeeded", category_folder, succeeded, total)
     
     def save_all_contributions_data(self, oral: List[Dict], posters: List[Dict], others: List[Dict]):
         """Save all contributions data in various formats."""
@@ -365,29 +499,33 @@ class LLRF2025Scraper:
         
         # JSON format
         json_file = self.output_dir / "LLRF2025_All_Contributions.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'event_info': {
-                    'title': self.event_data.get('title', ''),
-                    'id': self.event_data.get('id', ''),
-                    'start_date': self.event_data.get('startDate', {}),
-                    'end_date': self.event_data.get('endDate', {}),
-                    'location': self.event_data.get('location', ''),
-                    'url': self.event_data.get('url', ''),
-                },
-                'statistics': {
-                    'total_contributions': len(all_contributions),
-                    'oral_presentations': len(oral),
-                    'posters': len(posters),
-                    'others': len(others)
-                },
-                'contributions': {
-                    'oral_presentations': oral,
-                    'posters': posters,
-                    'others': others
-                },
-                'scrape_time': datetime.now().isoformat()
-            }, f, ensure_ascii=False, indent=2)
+        event_info = {
+            'title': self.event_data.get('title', ''),
+            'id': self.event_data.get('id', ''),
+            'start_date': self.event_data.get('startDate', {}),
+            'end_date': self.event_data.get('endDate', {}),
+            'location': self.event_data.get('location', ''),
+            'url': self.event_data.get('url', ''),
+        }
+        statistics = {
+            'total_contributions': len(all_contributions),
+            'oral_presentations': len(oral),
+            'posters': len(posters),
+            'others': len(others)
+        }
+        
+        # Stream one contribution at a time instead of serializing the whole document
+        with open(json_file, 'wb') as f:
+            f.write(b'{\n  "event_info": ' + _dump_indented(event_info, 1))
+            f.write(b',\n  "statistics": ' + _dump_indented(statistics, 1))
+            f.write(b',\n  "contributions": {')
+            for n, (key, contribs) in enumerate((('oral_presentations', oral), ('posters', posters), ('others', others))):
+                f.write((b',\n    ' if n else b'\n    ') + orjson.dumps(key) + b': [')
+                for i, contrib in enumerate(contribs):
+                    f.write(b',\n      ' if i else b'\n      ')
+                    f.write(_dump_indented(self._public_fields(contrib), 3))
+                f.write(b'\n    ]' if contribs else b']')
+            f.write(b'\n  },\n  "scrape_time": ' + orjson.dumps(self._scrape_time.isoformat()) + b'\n}')
         
         self.logger.info(f"Saved JSON data: {json_file}")
         
@@ -402,138 +540,121 @@ class LLRF2025Scraper:
         import csv
         
         csv_file = self.output_dir / "LLRF2025_All_Contributions.csv"
-        with open(csv_file, 'w', newline='', encoding='utf-8-sig') as f:
-            fieldnames = [
-                'id', 'friendly_id', 'title', 'type', 'start_date', 'start_time',
-                'duration', 'speakers', 'primary_authors', 'coauthors', 'affiliations',
-                'description', 'attachment_count', 'url', 'session', 'location', 'room'
-            ]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+        with open(csv_file, 'w', newline='', encoding='utf-8-sig', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(_CSV_FIELDNAMES)
             
+            extractors = [extract for _, extract in _CSV_COLUMNS]
             for contrib in contributions:
-                # Format speakers
-                speakers = '; '.join([s['name'] for s in contrib.get('speakers', [])])
-                primary_authors = '; '.join([a['name'] for a in contrib.get('primary_authors', [])])
-                coauthors = '; '.join([a['name'] for a in contrib.get('coauthors', [])])
-                
-                # Get all affiliations
-                all_affiliations = set()
-                for person_list in [contrib.get('speakers', []), contrib.get('primary_authors', []), contrib.get('coauthors', [])]:
-                    for person in person_list:
-                        if person.get('affiliation'):
-                            all_affiliations.add(person['affiliation'])
-                
-                row = {
-                    'id': contrib.get('id', ''),
-                    'friendly_id': contrib.get('friendly_id', ''),
-                    'title': contrib.get('title', ''),
-                    'type': contrib.get('type', ''),
-                    'start_date': contrib.get('start_date', ''),
-                    'start_time': contrib.get('start_time', ''),
-                    'duration': contrib.get('duration', ''),
-                    'speakers': speakers,
-                    'primary_authors': primary_authors,
-                    'coauthors': coauthors,
-                    'affiliations': '; '.join(sorted(all_affiliations)),
-                    'description': contrib.get('description', '')[:500],  # Truncate long descriptions
-                    'attachment_count': contrib.get('attachment_count', 0),
-                    'url': contrib.get('url', ''),
-                    'session': contrib.get('session', ''),
-                    'location': contrib.get('location', ''),
-                    'room': contrib.get('room', '')
-                }
-                writer.writerow(row)
+                writer.writerow([extract(contrib) for extract in extractors])
         
         self.logger.info(f"Saved CSV data: {csv_file}")
     
     def save_text_summary(self, oral: List[Dict], posters: List[Dict], others: List[Dict]):
         """Save text summary report."""
         txt_file = self.output_dir / "LLRF2025_Summary.txt"
-        with open(txt_file, 'w', encoding='utf-8') as f:
-            f.write("LLRF2025 Conference Complete Scraping Report\n")
-            f.write("=" * 80 + "\n")
-            f.write(f"Event: {self.event_data.get('title', '')}\n")
-            f.write(f"Event ID: {self.event_data.get('id', '')}\n")
-            f.write(f"URL: {self.event_data.get('url', '')}\n")
-            f.write(f"Scrape time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            f.write(f"Statistics:\n")
-            f.write(f"  Total contributions: {len(oral) + len(posters) + len(others)}\n")
-            f.write(f"  Oral presentations: {len(oral)}\n")
-            f.write(f"  Posters: {len(posters)}\n")
-            f.write(f"  Others: {len(others)}\n")
-            f.write(f"  Downloaded files: {self.stats['downloaded_files']}\n")
-            f.write(f"  Errors: {self.stats['errors']}\n")
-            f.write("=" * 80 + "\n\n")
-            
-            # Oral presentations
-            if oral:
-                f.write("ORAL PRESENTATIONS\n")
-                f.write("-" * 80 + "\n")
-                for i, contrib in enumerate(oral, 1):
-                    self._write_contribution_summary(f, contrib, i)
-                f.write("\n")
-            
-            # Posters
-            if posters:
-                f.write("POSTERS\n")
-                f.write("-" * 80 + "\n")
-                for i, contrib in enumerate(posters, 1):
-                    self._write_contribution_summary(f, contrib, i)
-                f.write("\n")
-            
-            # Others
-            if others:
-                f.write("OTHER CONTRIBUTIONS\n")
-                f.write("-" * 80 + "\n")
-                for i, contrib in enumerate(others, 1):
-                    self._write_contribution_summary(f, contrib, i)
-        
+        parts = []
+        parts.append("LLRF2025 Conference Complete Scraping Report\n")
+        parts.append("=" * 80 + "\n")
+        parts.append(f"Event: {self.event_data.get('title', '')}\n")
+        parts.append(f"Event ID: {self.event_data.get('id', '')}\n")
+        parts.append(f"URL: {self.event_data.get('url', '')}\n")
+        parts.append(f"Scrape time: {self._scrape_time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        
+        parts.append(f"Statistics:\n")
+        parts.append(f"  Total contributions: {len(oral) + len(posters) + len(others)}\n")
+        parts.append(f"  Oral presentations: {len(oral)}\n")
+        parts.append(f"  Posters: {len(posters)}\n")
+        parts.append(f"  Others: {len(others)}\n")
+        parts.append(f"  Downloaded files: {self.stats['downloaded_files']}\n")
+        parts.append(f"  Errors: {self.stats['errors']}\n")
+        parts.append("=" * 80 + "\n\n")
+        
+        # Oral presentations
+        if oral:
+            parts.append("ORAL PRESENTATIONS\n")
+            parts.append("-" * 80 + "\n")
+            for i, contrib in enumerate(oral, 1):
+                parts.append(self._format_contribution_summary(contrib, i))
+            parts.append("\n")
+        
+        # Posters
+        if posters:
+            parts.append("POSTERS\n")
+            parts.append("-" * 80 + "\n")
+            for i, contrib in enumerate(posters, 1):
+                parts.append(self._format_contribution_summary(contrib, i))
+            parts.append("\n")
+        
+        # Others
+        if others:
+            parts.append("OTHER CONTRIBUTIONS\n")
+            parts.append("-" * 80 + "\n")
+            for i, contrib in enumerate(others, 1):
+                parts.append(self._format_contribution_summary(contrib, i))
+        
+        txt_file.write_text(''.join(parts), encoding='utf-8')
         self.logger.info(f"Saved text summary: {txt_file}")
     
-    def _write_contribution_summary(self, f, contrib: Dict[str, Any], index: int):
-        """Write a single contribution summary to file."""
-        f.write(f"{index}. [{contrib.get('friendly_id', contrib.get('id', 'N/A'))}] {contrib['title']}\n")
-        f.write(f"   Type: {contrib.get('type', 'N/A')}\n")
-        f.write(f"   Date/Time: {contrib.get('start_date', '')} {contrib.get('start_time', '')} ({contrib.get('duration', 0)} min)\n")
-        
-        if contrib.get('speakers'):
-            speakers = ', '.join([s['name'] for s in contrib['speakers']])
-            f.write(f"   Speakers: {speakers}\n")
-        
-        if contrib.get('primary_authors'):
-            authors = ', '.join([a['name'] for a in contrib['primary_authors']])
-            f.write(f"   Primary Authors: {authors}\n")
-        
-        if contrib.get('coauthors'):
-            coauthors = ', '.join([a['name'] for a in contrib['coauthors']])
-            f.write(f"   Co-authors: {coauthors}\n")
-        
-        if contrib.get('attachments'):
-            f.write(f"   Attachments ({len(contrib['attachments'])}):\n")
-            for att in contrib['attachments']:
-                f.write(f"     - {att['filename']} ({att.get('size', 0)} bytes)\n")
+    def _format_contribution_summary(self, contrib: Dict[str, Any], index: int) -> str:
+        """
+        Format a single contribution summary for the text reports.
         
-        f.write(f"   URL: {contrib.get('url', '')}\n")
+        The rendered text (everything after the index prefix) is cached by
+        contribution id, so the global summary and per-date files share it.
         
-        if contrib.get('description'):
-            desc = contrib['description'][:200] + '...' if len(contrib['description']) > 200 else contrib['description']
-            f.write(f"   Description: {desc}\n")
+        Args:
+            contrib: Parsed contribution dictionary
+            index: Position of the contribution in the enclosing list
+            
+        Returns:
+            Summary text block, ending with a blank line
+        """
+        cache_key = contrib.get('id')
+        body = self._summary_cache.get(cache_key)
+        if body is None:
+            parts = [f"[{contrib.get('friendly_id', contrib.get('id', 'N/A'))}] {contrib['title']}\n"]
+            parts.append(f"   Type: {contrib.get('type', 'N/A')}\n")
+            parts.append(f"   Date/Time: {contrib.get('start_date', '')} {contrib.get('start_time', '')} ({contrib.get('duration', 0)} min)\n")
+            
+            if contrib.get('speakers'):
+                speakers = ', '.join([s['name'] for s in contrib['speakers']])
+                parts.append(f"   Speakers: {speakers}\n")
+            
+            if contrib.get('primary_authors'):
+                authors = ', '.join([a['name'] for a in contrib['primary_authors']])
+                parts.append(f"   Primary Authors: {authors}\n")
+            
+            if contrib.get('coauthors'):
+                coauthors = ', '.join([a['name'] for a in contrib['coauthors']])
+                parts.append(f"   Co-authors: {coauthors}\n")
+            
+            if contrib.get('attachments'):
+                parts.append(f"   Attachments ({len(contrib['attachments'])}):\n")
+                for att in contrib['attachments']:
+                    parts.append(f"     - {att['filename']} ({att.get('size', 0)} bytes)\n")
+            
+            parts.append(f"   URL: {contrib.get('url', '')}\n")
+            
+            if contrib.get('description'):
+                desc = contrib['description'][:200] + '...' if len(contrib['description']) > 200 else contrib['description']
+                parts.append(f"   Description: {desc}\n")
+            
+            parts.append("\n")
+            body = ''.join(parts)
+            if cache_key:
+                self._summary_cache[cache_key] = body
         
-        f.write("\n")
+        return f"{index}. {body}"
     
     def save_by_date(self, contributions: List[Dict[str, Any]]):
         """Group and save contributions by date."""
         self.logger.info("\nGrouping contributions by date...")
         
         # Group by date
-        by_date = {}
+        by_date = defaultdict(list)
         for contrib in contributions:
-            date = contrib.get('start_date', 'Unknown')
-            if date not in by_date:
-                by_date[date] = []
-            by_date[date].append(contrib)
+            by_date[contrib.get('start_date', 'Unknown')].append(contrib)
         
         # Save each date
         for date, date_contribs in sorted(by_date.items()):
@@ -543,22 +664,22 @@ class LLRF2025Scraper:
             
             # JSON
             json_file = date_dir / f"{date_str}_contributions.json"
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump({
+            with open(json_file, 'wb') as f:
+                f.write(orjson.dumps({
                     'date': date,
                     'count': len(date_contribs),
-                    'contributions': date_contribs
-                }, f, ensure_ascii=False, indent=2)
+                    'contributions': [self._public_fields(c) for c in date_contribs]
+                }, option=orjson.OPT_INDENT_2, default=str))
             
             # Text summary
             txt_file = date_dir / f"{date_str}_summary.txt"
-            with open(txt_file, 'w', encoding='utf-8') as f:
-                f.write(f"LLRF2025 - Contributions on {date}\n")
-                f.write("=" * 80 + "\n")
-                f.write(f"Total contributions: {len(date_contribs)}\n\n")
-                
-                for i, contrib in enumerate(date_contribs, 1):
-                    self._write_contribution_summary(f, contrib, i)
+            parts = []
+            parts.append(f"LLRF2025 - Contributions on {date}\n")
+            parts.append("=" * 80 + "\n")
+            parts.append(f"Total contributions: {len(date_contribs)}\n\n")
+            parts.extend(self._format_contribution_summary(contrib, i)
+                         for i, contrib in enumerate(date_contribs, 1))
+            txt_file.write_text(''.join(parts), encoding='utf-8')
             
             self.logger.info(f"  {date}: {len(date_contribs)} contributions")
     